@@ -0,0 +1,209 @@
+from array import array
+from dataclasses import asdict, astuple
+
+import numpy as np
+import pytest
+
+import triadic_forgiveness_operator as tfo
+from triadic_forgiveness_operator import (
+    BloomMemoryLog,
+    ConfessionRecord,
+    DeterminationState,
+    ForgivenessOperator,
+    TriadicState,
+)
+
+SATURATED = [12.0, -12.0, 40.0, -40.0, 60.0, -60.0, 100.0, -100.0]
+
+PARAMETERS = [
+    (0.3, 0.3, 0.2),
+    (0.0, 0.0, 0.0),
+    (0.0, 0.3, 0.2),
+    (0.9, 0.05, 0.6),
+    (1.0, 0.7, 0.9),
+]
+
+
+def _confession(z) -> ConfessionRecord:
+    return ConfessionRecord(
+        time=0.0,
+        state=TriadicState(z),
+        coherence=0.0,
+        divergence=0.0,
+        error_description="test",
+        witnessed=True,
+    )
+
+
+def _baseline_forgive(z, memory_decay_rate, dwelling_boost, closure_reduction):
+    # forgive() as first released: sigmoid every channel, update, clip, logit.
+    x = 1.0 / (1.0 + np.exp(-np.clip(z, -60, 60)))
+    released = np.array([
+        max(x[3] - closure_reduction, 0.1),
+        (1 - memory_decay_rate) * x[4] + memory_decay_rate * 0.5,
+        (1 - memory_decay_rate) * x[5] + memory_decay_rate * 0.5,
+        min(x[6] + dwelling_boost, 0.95),
+    ])
+    released = np.clip(released, 1e-9, 1.0 - 1e-9)
+    return np.concatenate([z[:3], np.log(released / (1.0 - released))])
+
+
+def _states() -> list:
+    rng = np.random.default_rng(0)
+    states = [rng.normal(scale=s, size=7) for s in (1.0, 5.0, 30.0) for _ in range(100)]
+    states += [np.full(7, z) for z in SATURATED]
+    states += [rng.choice(SATURATED, size=7) for _ in range(50)]
+    return states
+
+
+@pytest.mark.parametrize("params", PARAMETERS)
+def test_forgive_matches_the_baseline_formula(params):
+    for z in _states():
+        restored = ForgivenessOperator.forgive(_confession(z), *params).z
+        np.testing.assert_allclose(restored, _baseline_forgive(z, *params), rtol=0.0, atol=1e-9)
+
+
+@pytest.mark.parametrize("params", PARAMETERS)
+def test_forgive_batch_matches_forgive_row_by_row(params):
+    states = _states()
+    batch = ForgivenessOperator.forgive_batch([_confession(z) for z in states], *params)
+    for row, z in zip(batch, states):
+        expected = ForgivenessOperator.forgive(_confession(z), *params).z
+        np.testing.assert_allclose(row, expected, rtol=0.0, atol=1e-9)
+
+
+def test_forgive_batch_identity_parameters_keep_saturated_logits():
+    z = [0.0, 0.0, 0.0, 12.0, 12.0, -12.0, 0.0]
+    batch = ForgivenessOperator.forgive_batch([_confession(z)], 0.0, 0.0, 0.0)
+    np.testing.assert_allclose(batch[0], z, rtol=0.0, atol=1e-9)
+
+
+@pytest.mark.parametrize("params", PARAMETERS)
+def test_jit_kernel_matches_python_kernel(params):
+    pytest.importorskip("numba")
+    if not tfo._JIT_ENABLED:
+        pytest.skip("compiled build does not use numba")
+    for z in _states():
+        args = (*z[3:], *params)
+        np.testing.assert_allclose(tfo._forgive_kernel(*args),
+                                   tfo._forgive_kernel.py_func(*args),
+                                   rtol=0.0, atol=1e-12)
+
+
+def test_forgive_batch_rejects_a_repeated_confession():
+    confession = _confession(np.zeros(7))
+    with pytest.raises(ValueError):
+        ForgivenessOperator.forgive_batch([confession, _confession(np.zeros(7)), confession])
+    assert confession.determination == DeterminationState.UNKNOWN
+
+
+def test_component_accessors_read_the_logit_vector():
+    state = TriadicState([0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5])
+    components = [state.z1, state.z2, state.z3, state.zc, state.zMf, state.zMs, state.zD]
+    assert components == [0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5]
+    assert all(type(value) is float for value in components)
+
+
+def test_from_logits_defaults_missing_components():
+    assert TriadicState.from_logits() == TriadicState()
+    state = TriadicState.from_logits(zc=1.0)
+    default = TriadicState().z
+    assert state.z == default[:3] + (1.0,) + default[4:]
+
+
+def test_state_copies_its_input_buffer():
+    buffer = array('d', [0.0] * 7)
+    state = TriadicState(buffer)
+    assert state.to_sigmoid.closure == 0.5
+    buffer[3] = 50.0
+    assert state.zc == 0.0
+    assert state.to_sigmoid.closure == 0.5
+
+
+def test_bloom_memory_log_has_no_false_negatives():
+    log = BloomMemoryLog(capacity=1000)
+    signatures = [f"error-{i}" for i in range(1000)]
+    for signature in signatures:
+        ForgivenessOperator.forget(signature, log)
+    assert all(signature in log for signature in signatures)
+
+
+def test_bloom_memory_log_false_positive_rate_near_target_at_capacity():
+    log = BloomMemoryLog(capacity=1000, false_positive_rate=0.01)
+    for i in range(1000):
+        log.add(f"error-{i}")
+    false_positives = sum(f"other-{i}" in log for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.parametrize("capacity, rate", [(0, 0.01), (-5, 0.01), (10, 0.0), (10, 1.0), (10, 1.5)])
+def test_bloom_memory_log_rejects_bad_sizing(capacity, rate):
+    with pytest.raises(ValueError):
+        BloomMemoryLog(capacity, rate)
+
+
+def test_forget_accepts_a_plain_set():
+    log: set = set()
+    ForgivenessOperator.forget("error", log)
+    assert log == {"error"}
+
+
+def test_sigmoid_cache_stays_out_of_the_dataclass_fields():
+    state = TriadicState()
+    before = asdict(state), astuple(state), repr(state)
+    state.to_sigmoid
+    assert (asdict(state), astuple(state), repr(state)) == before
+    assert state == TriadicState()
+
+
+
+def test_facet_metrics_matches_sigmoid_product_and_std():
+    for z in _states():
+        state = TriadicState(z)
+        view = state.to_sigmoid
+        facets = [view.x1, view.x2, view.x3]
+        x1, x2, x3, coherence, divergence = state.facet_metrics()
+        assert [x1, x2, x3] == facets
+        assert coherence == pytest.approx(np.prod(facets), rel=1e-12, abs=1e-300)
+        assert divergence == pytest.approx(np.std(facets), rel=1e-9, abs=1e-15)
+
+
+def test_to_sigmoid_is_cached():
+    state = TriadicState()
+    assert state.to_sigmoid is state.to_sigmoid
+
+
+BASELINE_DEMO_OUTPUT = """\
+ERROR STATE DETECTED:
+  Closure: 0.900 (very high - locked in)
+  Divergence: 0.262 (facets misaligned)
+  Dwelling: 0.100 (very low - brittle)
+  Coherence: 0.048
+
+CONFESSION RECORDED:
+  Error: System locked into high closure with divergent facets
+  Witnessed: True
+
+FORGIVENESS APPLIED:
+  Closure: 0.900 → 0.700 (re-opened)
+  Dwelling: 0.100 → 0.400 (restored)
+  Memory (fast): 0.700 → 0.640 (decayed)
+  Memory (slow): 0.600 → 0.570 (decayed)
+  Facets preserved (learning intact)
+
+RESULT:
+  ✓ Error acknowledged
+  ✓ Constraint released
+  ✓ Learning preserved
+  ✓ Capacity restored
+  ✓ Growth enabled
+
+The instrument breathes. The topography lives.
+
+System can now continue learning without permanent damage.
+"""
+
+
+def test_demonstration_output_matches_the_baseline(capsys):
+    tfo.demonstrate_forgiveness()
+    assert capsys.readouterr().out == BASELINE_DEMO_OUTPUT
@@ -21,15 +21,45 @@ This is the core mechanism that allows systems to:
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any, Callable, Final, NamedTuple, Sequence, TypeVar, cast
+import math
+import types
 import numpy as np
 
+try:
+    import numba as _numba  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # numba is optional; without it the kernels run as plain Python
+    _numba = None  # type: ignore[assignment]
+
+def _probe() -> None:
+    pass
+
+# A mypyc-compiled build turns every function in this module into a native
+# builtin. numba can only trace interpreted Python functions, so the JIT is
+# enabled only when numba is installed and this module runs interpreted.
+_INTERPRETED: Final = isinstance(_probe, types.FunctionType)
+_JIT_ENABLED: Final = _numba is not None and _INTERPRETED
+
+_F = TypeVar('_F', bound=Callable[..., Any])
+
+def _jit(func: _F) -> _F:
+    return cast(_F, _numba.njit(cache=True)(func)) if _JIT_ENABLED else func
+
 def sigmoid(z: float) -> float:
-    z = np.clip(z, -60, 60)
-    return 1.0 / (1.0 + np.exp(-z))
+    z = -60.0 if z < -60.0 else (60.0 if z > 60.0 else z)
+    return 1.0 / (1.0 + math.exp(-z))
 
 def logit(x: float) -> float:
-    x = np.clip(x, 1e-9, 1.0 - 1e-9)
-    return np.log(x / (1.0 - x))
+    if x < 1e-9:
+        x = 1e-9
+    elif x > 1.0 - 1e-9:
+        x = 1.0 - 1e-9
+    # log1p keeps log(1 - x) accurate as x approaches either clamp.
+    return math.log(x) - math.log1p(-x)
+
+# Logits of the percentiles 0.01..0.99, keyed by probability, for the fixed
+# seed values used by state defaults and the demonstration.
+_LOGIT_TABLE: Final = {k / 100: logit(k / 100) for k in range(1, 100)}
 
 class DeterminationState(Enum):
     UNKNOWN = "unknown"
@@ -37,28 +67,161 @@ class DeterminationState(Enum):
     AUTHORIZED_FLAG = "flag"
     FORGIVEN = "forgiven"
 
-@dataclass
-class TriadicState:
-    z1: float = logit(0.2)
-    z2: float = logit(0.1)
-    z3: float = logit(0.15)
-    zc: float = logit(0.05)
-    zMf: float = logit(0.1)
-    zMs: float = logit(0.1)
-    zD: float = logit(0.6)
-
-    def to_sigmoid(self) -> dict:
-        return {
-            'x1': sigmoid(self.z1),
-            'x2': sigmoid(self.z2),
-            'x3': sigmoid(self.z3),
-            'closure': sigmoid(self.zc),
-            'memory_fast': sigmoid(self.zMf),
-            'memory_slow': sigmoid(self.zMs),
-            'dwelling': sigmoid(self.zD),
-        }
-
-@dataclass
+# Positions of each component within TriadicState.z
+Z1, Z2, Z3, ZC, ZMF, ZMS, ZD = range(7)
+
+class SigmoidView(NamedTuple):
+    x1: float
+    x2: float
+    x3: float
+    closure: float
+    memory_fast: float
+    memory_slow: float
+    dwelling: float
+
+# The array kernels below call these ufuncs with out= buffers, so each step
+# skips the np.<name> lookup and reuses memory instead of allocating. Clamping
+# goes through maximum/minimum: np.clip is a Python-level array-function
+# dispatcher, not a ufunc.
+_maximum, _minimum = np.maximum, np.minimum
+_negative, _reciprocal = np.negative, np.reciprocal
+_exp, _log, _log1p = np.exp, np.log, np.log1p
+
+def _sigmoid_vec(z: np.ndarray, out: np.ndarray) -> np.ndarray:
+    _maximum(z, -60.0, out=out)
+    _minimum(out, 60.0, out=out)
+    _negative(out, out=out)
+    _exp(out, out=out)
+    out += 1.0
+    return _reciprocal(out, out=out)
+
+# Bounds on (closure, memory_fast, memory_slow, dwelling) after release.
+_RELEASE_FLOOR: Final = np.array([0.1, 1e-9, 1e-9, 1e-9])
+_RELEASE_CEIL: Final = np.array([1.0 - 1e-9, 1.0 - 1e-9, 1.0 - 1e-9, 0.95])
+
+def _release(x_tail: np.ndarray, memory_decay_rate: float, dwelling_boost: float,
+             closure_reduction: float) -> np.ndarray:
+    """Map bounded (closure, memory_fast, memory_slow, dwelling) to released logits.
+
+    Works in place: ``x_tail`` is overwritten with, and returned as, the logits.
+    """
+    # Columns are (closure, memory_fast, memory_slow, dwelling); each update is
+    # an in-place scalar op on a column view, so no constant arrays are built.
+    x_tail[..., 0] -= closure_reduction
+    memory = x_tail[..., 1:3]
+    memory *= 1.0 - memory_decay_rate
+    memory += memory_decay_rate * 0.5
+    x_tail[..., 3] += dwelling_boost
+    _maximum(x_tail, _RELEASE_FLOOR, out=x_tail)
+    _minimum(x_tail, _RELEASE_CEIL, out=x_tail)
+    scratch = _negative(x_tail)
+    _log1p(scratch, out=scratch)
+    _log(x_tail, out=x_tail)
+    x_tail -= scratch
+    return x_tail
+
+@_jit
+def _forgive_kernel(zc: float, zMf: float, zMs: float, zD: float,
+                    memory_decay_rate: float, dwelling_boost: float,
+                    closure_reduction: float) -> tuple[float, float, float, float]:
+    c = 1.0 / (1.0 + math.exp(-min(max(zc, -60.0), 60.0)))
+    Mf = 1.0 / (1.0 + math.exp(-min(max(zMf, -60.0), 60.0)))
+    Ms = 1.0 / (1.0 + math.exp(-min(max(zMs, -60.0), 60.0)))
+    D = 1.0 / (1.0 + math.exp(-min(max(zD, -60.0), 60.0)))
+
+    # One clamp per channel, folding the release bounds into logit's margin
+    # (same bounds as _RELEASE_FLOOR/_RELEASE_CEIL).
+    c = min(max(c - closure_reduction, 0.1), 1.0 - 1e-9)
+    Mf = min(max((1 - memory_decay_rate) * Mf + memory_decay_rate * 0.5, 1e-9), 1.0 - 1e-9)
+    Ms = min(max((1 - memory_decay_rate) * Ms + memory_decay_rate * 0.5, 1e-9), 1.0 - 1e-9)
+    D = min(max(D + dwelling_boost, 1e-9), 0.95)
+    return (math.log(c) - math.log1p(-c), math.log(Mf) - math.log1p(-Mf),
+            math.log(Ms) - math.log1p(-Ms), math.log(D) - math.log1p(-D))
+
+_DEFAULT_Z: Final = (
+    _LOGIT_TABLE[0.2], _LOGIT_TABLE[0.1], _LOGIT_TABLE[0.15], _LOGIT_TABLE[0.05],
+    _LOGIT_TABLE[0.1], _LOGIT_TABLE[0.1], _LOGIT_TABLE[0.6],
+)
+
+class _SigmoidCache:
+    # Extra slot for TriadicState's sigmoid cache. Living outside the dataclass
+    # fields keeps it out of fields(), asdict(), astuple(), eq and repr.
+    __slots__ = ('_sigmoid',)
+    _sigmoid: SigmoidView
+
+    def _store_sigmoid(self, view: SigmoidView) -> SigmoidView:
+        # object.__setattr__ bypasses the frozen dataclass __setattr__.
+        object.__setattr__(self, '_sigmoid', view)
+        return view
+
+@dataclass(frozen=True, slots=True)
+class TriadicState(_SigmoidCache):
+    # Any 7-long sequence is accepted, but __post_init__ always stores a fresh
+    # tuple of floats: scalar paths index it without touching NumPy, and
+    # nothing outside the state can change it behind the cache. An array('d')
+    # would be smaller but mutable through z, so the tuple is kept.
+    z: Sequence[float] = _DEFAULT_Z
+
+    @property
+    def z1(self) -> float:
+        return self.z[Z1]
+
+    @property
+    def z2(self) -> float:
+        return self.z[Z2]
+
+    @property
+    def z3(self) -> float:
+        return self.z[Z3]
+
+    @property
+    def zc(self) -> float:
+        return self.z[ZC]
+
+    @property
+    def zMf(self) -> float:
+        return self.z[ZMF]
+
+    @property
+    def zMs(self) -> float:
+        return self.z[ZMS]
+
+    @property
+    def zD(self) -> float:
+        return self.z[ZD]
+
+    def __post_init__(self):
+        # Always take a private copy so no caller-held buffer aliases the state.
+        z = tuple(map(float, self.z))
+        object.__setattr__(self, 'z', z)
+        if len(z) != 7:
+            raise ValueError("TriadicState requires exactly 7 logit components")
+
+    @classmethod
+    def from_logits(cls, z1: float = _DEFAULT_Z[Z1], z2: float = _DEFAULT_Z[Z2],
+                    z3: float = _DEFAULT_Z[Z3], zc: float = _DEFAULT_Z[ZC],
+                    zMf: float = _DEFAULT_Z[ZMF], zMs: float = _DEFAULT_Z[ZMS],
+                    zD: float = _DEFAULT_Z[ZD]) -> "TriadicState":
+        return cls((z1, z2, z3, zc, zMf, zMs, zD))
+
+    @property
+    def to_sigmoid(self) -> SigmoidView:
+        # Slots leave no __dict__ for functools.cached_property, so cache by hand;
+        # the slot stays unset until the first read.
+        try:
+            return self._sigmoid
+        except AttributeError:
+            return self._store_sigmoid(SigmoidView._make(map(sigmoid, self.z)))
+
+    def facet_metrics(self) -> tuple[float, float, float, float, float]:
+        """Return (x1, x2, x3, coherence, divergence) from the three facets alone."""
+        z = self.z
+        x1, x2, x3 = sigmoid(z[Z1]), sigmoid(z[Z2]), sigmoid(z[Z3])
+        mean = (x1 + x2 + x3) / 3.0
+        divergence = math.sqrt(((x1 - mean) ** 2 + (x2 - mean) ** 2 + (x3 - mean) ** 2) / 3.0)
+        return x1, x2, x3, x1 * x2 * x3, divergence
+
+@dataclass(slots=True)
 class ConfessionRecord:
     time: float
     state: TriadicState
@@ -73,6 +236,42 @@ class ConfessionRecord:
             raise ValueError("Cannot authorize without witness")
         self.determination = determination
 
+class BloomMemoryLog:
+    """Fixed-size Bloom filter of forgotten error signatures.
+
+    Memory stays at the bitmap size however many signatures are added.
+    Membership never misses a forgotten signature but may report a false
+    positive, at about ``false_positive_rate`` once ``capacity`` are stored.
+    Probe positions come from the built-in string hash, so a log is only
+    meaningful within the process that filled it.
+    """
+
+    def __init__(self, capacity: int = 100_000, false_positive_rate: float = 0.01):
+        if capacity <= 0 or not 0.0 < false_positive_rate < 1.0:
+            raise ValueError("capacity must be positive and false_positive_rate in (0, 1)")
+        bits = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        self._bitmap = bytearray((bits + 7) // 8)
+        self._bits = len(self._bitmap) * 8
+        self._hashes = max(1, round(bits / capacity * math.log(2)))
+
+    def _positions(self, signature: str) -> list[int]:
+        # str caches its hash, so this is one hash per signature at most; the k
+        # probe positions come from its 32-bit halves by double hashing.
+        h = hash(signature) & 0xFFFFFFFFFFFFFFFF
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        bits = self._bits
+        return [(h1 + i * h2) % bits for i in range(self._hashes)]
+
+    def add(self, signature: str) -> None:
+        bitmap = self._bitmap
+        for position in self._positions(signature):
+            bitmap[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, signature: str) -> bool:
+        bitmap = self._bitmap
+        return all(bitmap[position >> 3] >> (position & 7) & 1
+                   for position in self._positions(signature))
+
 class ForgivenessOperator:
     @staticmethod
     def forgive(confession: ConfessionRecord,
@@ -82,44 +281,89 @@ class ForgivenessOperator:
         if confession.determination != DeterminationState.UNKNOWN:
             raise ValueError("Can only forgive UNKNOWN states")
 
-        state = confession.state
-        bounded = state.to_sigmoid()
-
-        Mf_new = (1 - memory_decay_rate) * bounded['memory_fast'] + memory_decay_rate * 0.5
-        Ms_new = (1 - memory_decay_rate) * bounded['memory_slow'] + memory_decay_rate * 0.5
-        D_new = min(bounded['dwelling'] + dwelling_boost, 0.95)
-        c_new = max(bounded['closure'] - closure_reduction, 0.1)
-
-        restored = TriadicState(
-            z1=state.z1, z2=state.z2, z3=state.z3,
-            zc=logit(c_new),
-            zMf=logit(Mf_new),
-            zMs=logit(Ms_new),
-            zD=logit(D_new),
-        )
+        z = confession.state.z
+        # Facets z1..z3 pass through unchanged; only the mutable tail is rewritten.
+        tail = _forgive_kernel(z[ZC], z[ZMF], z[ZMS], z[ZD], memory_decay_rate,
+                               dwelling_boost, closure_reduction)
+        restored = TriadicState((z[Z1], z[Z2], z[Z3]) + tail)
 
         confession.authorize(DeterminationState.FORGIVEN)
         return restored
 
     @staticmethod
-    def forget(error_signature: str, memory_log: set) -> None:
+    def forgive_batch(confessions: list[ConfessionRecord],
+                      memory_decay_rate: float = 0.3,
+                      dwelling_boost: float = 0.3,
+                      closure_reduction: float = 0.2) -> np.ndarray:
+        """Forgive every confession; row i holds the restored logits of confessions[i]."""
+        # Validate up front so a bad record leaves the whole batch untouched. A
+        # record listed twice would be forgiven twice, which forgive() refuses.
+        seen: set[int] = set()
+        for confession in confessions:
+            if confession.determination != DeterminationState.UNKNOWN:
+                raise ValueError("Can only forgive UNKNOWN states")
+            if not confession.witnessed:
+                raise ValueError("Cannot authorize without witness")
+            if id(confession) in seen:
+                raise ValueError("Cannot forgive the same confession twice")
+            seen.add(id(confession))
+        if not confessions:
+            return np.empty((0, 7))
+
+        # Z is a fresh copy, so the mutable tail is taken through sigmoid and back
+        # in place on a view of it; facet columns never enter sigmoid space.
+        Z = np.array([confession.state.z for confession in confessions], dtype=np.float64)
+        tail = Z[:, ZC:]
+        # Exact sigmoid: the result goes straight back through logit, which
+        # would magnify any approximation error.
+        _sigmoid_vec(tail, tail)
+        _release(tail, memory_decay_rate, dwelling_boost, closure_reduction)
+
+        for confession in confessions:
+            confession.authorize(DeterminationState.FORGIVEN)
+        return Z
+
+    @staticmethod
+    def forget(error_signature: str, memory_log: BloomMemoryLog | set) -> None:
         memory_log.add(error_signature)
 
+# Rendered in one pass and written with a single print() call.
+_FORGIVENESS_REPORT: Final = """\
+ERROR STATE DETECTED:
+  Closure: {before.closure:.3f} (very high - locked in)
+  Divergence: {divergence:.3f} (facets misaligned)
+  Dwelling: {before.dwelling:.3f} (very low - brittle)
+  Coherence: {coherence:.3f}
+
+CONFESSION RECORDED:
+  Error: {error}
+  Witnessed: True
+
+FORGIVENESS APPLIED:
+  Closure: {before.closure:.3f} → {after.closure:.3f} (re-opened)
+  Dwelling: {before.dwelling:.3f} → {after.dwelling:.3f} (restored)
+  Memory (fast): {before.memory_fast:.3f} → {after.memory_fast:.3f} (decayed)
+  Memory (slow): {before.memory_slow:.3f} → {after.memory_slow:.3f} (decayed)
+  Facets preserved (learning intact)
+
+RESULT:
+  ✓ Error acknowledged
+  ✓ Constraint released
+  ✓ Learning preserved
+  ✓ Capacity restored
+  ✓ Growth enabled
+
+The instrument breathes. The topography lives.
+
+System can now continue learning without permanent damage."""
+
 def demonstrate_forgiveness():
-    error_state = TriadicState(
-        z1=logit(0.8), z2=logit(0.2), z3=logit(0.3),
-        zc=logit(0.9), zMf=logit(0.7), zMs=logit(0.6), zD=logit(0.1)
+    error_state = TriadicState.from_logits(
+        z1=_LOGIT_TABLE[0.8], z2=_LOGIT_TABLE[0.2], z3=_LOGIT_TABLE[0.3],
+        zc=_LOGIT_TABLE[0.9], zMf=_LOGIT_TABLE[0.7], zMs=_LOGIT_TABLE[0.6], zD=_LOGIT_TABLE[0.1]
     )
     
-    bounded = error_state.to_sigmoid()
-    coherence = bounded['x1'] * bounded['x2'] * bounded['x3']
-    divergence = np.std([bounded['x1'], bounded['x2'], bounded['x3']])
-
-    print("ERROR STATE DETECTED:")
-    print(f"  Closure: {bounded['closure']:.3f} (very high - locked in)")
-    print(f"  Divergence: {divergence:.3f} (facets misaligned)")
-    print(f"  Dwelling: {bounded['dwelling']:.3f} (very low - brittle)")
-    print(f"  Coherence: {coherence:.3f}\n")
+    _, _, _, coherence, divergence = error_state.facet_metrics()
     
     confession = ConfessionRecord(
         time=10.0,
@@ -130,28 +374,15 @@ def demonstrate_forgiveness():
         witnessed=True
     )
     
-    print("CONFESSION RECORDED:")
-    print(f"  Error: {confession.error_description}")
-    print(f"  Witnessed: True\n")
-    
     restored_state = ForgivenessOperator.forgive(confession)
-    restored = restored_state.to_sigmoid()
     
-    print("FORGIVENESS APPLIED:")
-    print(f"  Closure: {bounded['closure']:.3f} → {restored['closure']:.3f} (re-opened)")
-    print(f"  Dwelling: {bounded['dwelling']:.3f} → {restored['dwelling']:.3f} (restored)")
-    print(f"  Memory (fast): {bounded['memory_fast']:.3f} → {restored['memory_fast']:.3f} (decayed)")
-    print(f"  Memory (slow): {bounded['memory_slow']:.3f} → {restored['memory_slow']:.3f} (decayed)")
-    print(f"  Facets preserved (learning intact)\n")
-    
-    print("RESULT:")
-    print("  ✓ Error acknowledged")
-    print("  ✓ Constraint released")
-    print("  ✓ Learning preserved")
-    print("  ✓ Capacity restored")
-    print("  ✓ Growth enabled\n")
-    print("The instrument breathes. The topography lives.\n")
-    print("System can now continue learning without permanent damage.")
+    print(_FORGIVENESS_REPORT.format(
+        before=error_state.to_sigmoid,
+        after=restored_state.to_sigmoid,
+        coherence=coherence,
+        divergence=divergence,
+        error=confession.error_description,
+    ))
 
 if __name__ == "__main__":
     demonstrate_forgiveness()
\ No newline at end of file